@@ -1,23 +1,9 @@
 import os
 import re
-import inspect
+import sys
+import linecache
 import logging
-from datetime import datetime
-
-try:
-    # REQUIRED (might make optional at some point) dependency: dotmap
-    # nice dict wrapper class that allows calling entries as attributes OR keys
-    # e.g. DotMap.entry is equivalent to DotMap['entry']
-    from dotmap import DotMap
-
-except ModuleNotFoundError:
-    raise ModuleNotFoundError("DotMap module not installed")
-
-    # if/when I make this optional (will require some rewriting),
-    # all instances *WILL use dict-style definitions, 
-    # so if DotMap is not installed, we can just pass the user dicts instead
-    DotMap = dict
-    
+import functools
 
 if os.name == 'nt': # if on Windows
     try: 
@@ -33,16 +19,86 @@ if os.name == 'nt': # if on Windows
 
 # constants
 ECHO_LEVEL = logging.DEBUG + 5
-__ANSI_ESC = '\033[' # could also be defined as '\x1b['
-__ANSI_COLORS = ['black', 'red', 'green', 'yellow', 'blue', 'magenta', 'cyan', 'white', 'gray']
-__ANSI_COLORS_ABBV = ['k', 'r',  'g',     'y',      'b',    'm',       'c',    'w',     'gy']
+__ARG_RE = re.compile(r"\((.*)\)") # pulls the argument list out of an echo(...) call
+
+# root logger once get_logger() has configured it, so that echo()/newline()
+# don't have to redo the lookup + handler checks on every call
+__default_logger = None
+
+# dict whose entries can also be accessed as attributes, e.g. C.red is equivalent to C['red'].
+# the instance __dict__ *is* the dict, so attribute access is just a regular dict lookup
+class __AttrDict(dict):
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.__dict__ = self
+
+# dictionary of ANSI color codes ('\033[' is the escape sequence, could also be written '\x1b[')
+# each color is also available by its abbreviation, and with a 'bg_' prefix for the background color
+C = __AttrDict({
+    'black':   '\033[30;1m', 'k':  '\033[30;1m', 'bg_black':   '\033[40;1m', 'bg_k':  '\033[40;1m',
+    'red':     '\033[31;1m', 'r':  '\033[31;1m', 'bg_red':     '\033[41;1m', 'bg_r':  '\033[41;1m',
+    'green':   '\033[32;1m', 'g':  '\033[32;1m', 'bg_green':   '\033[42;1m', 'bg_g':  '\033[42;1m',
+    'yellow':  '\033[33;1m', 'y':  '\033[33;1m', 'bg_yellow':  '\033[43;1m', 'bg_y':  '\033[43;1m',
+    'blue':    '\033[34;1m', 'b':  '\033[34;1m', 'bg_blue':    '\033[44;1m', 'bg_b':  '\033[44;1m',
+    'magenta': '\033[35;1m', 'm':  '\033[35;1m', 'bg_magenta': '\033[45;1m', 'bg_m':  '\033[45;1m',
+    'cyan':    '\033[36;1m', 'c':  '\033[36;1m', 'bg_cyan':    '\033[46;1m', 'bg_c':  '\033[46;1m',
+    'white':   '\033[37;1m', 'w':  '\033[37;1m', 'bg_white':   '\033[47;1m', 'bg_w':  '\033[47;1m',
+    'gray':    '\033[38;1m', 'gy': '\033[38;1m', 'bg_gray':    '\033[48;1m', 'bg_gy': '\033[48;1m',
+    'reset':   '\033[0m',
+})
 
-# dictionary of ANSI color codes
-C = DotMap()
-for i, c in enumerate(__ANSI_COLORS):
-    C[c] = C[__ANSI_COLORS_ABBV[i]] = f'{__ANSI_ESC}3{i};1m'
-    C['bg_'+c] = C['bg_'+__ANSI_COLORS_ABBV[i]] = f'{__ANSI_ESC}4{i};1m'
-C['reset'] = f"{__ANSI_ESC}0m"
+# same keys as C, but empty, for when output shouldn't be colored
+__NO_COLOR = __AttrDict.fromkeys(C, '')
+
+# color table used by echo(), matching whatever the root logger's output supports
+__echo_colors = C
+
+# logging tags for formatting
+__TAGS_SHORT = {
+    'DEBUG'     : "/",
+    'INFO'      : "-",
+    'ECHO'      : ">",
+    'WARNING'   : "!",
+    # 'NOTIF'   : "o",
+    'ERROR'     : "x",
+    'CRITICAL'  : "X",
+    'NOTSET'    : "?",
+}
+__TAGS_LONG_BASE = {
+    'DEBUG'     : "DEBUG",
+    'INFO'      : "INFO",
+    'ECHO'      : "ECHO",
+    'WARNING'   : "WARN",
+    # 'NOTIF'   : "NOTIF",
+    'ERROR'     : "ERROR",
+    'CRITICAL'  : "FATAL",
+    'NOTSET'    : "UNSET",
+}
+# both long formats pad the 4-letter tags so they line up with the 5-letter ones,
+# and 'long' also carries the opening bracket on the tag itself
+__TAGS_LONG = {lvl: (' [' if len(tag) == 4 else '[') + tag for lvl, tag in __TAGS_LONG_BASE.items()}
+__TAGS_LONG_TIME = {lvl: (' ' if len(tag) == 4 else '') + tag for lvl, tag in __TAGS_LONG_BASE.items()}
+
+# header format string and level tags for each supported `fmt`
+__FORMATS = {
+    'short'     : ("[%(levelname)s]",                           __TAGS_SHORT),
+    'short-time': ("%(asctime)s.%(msecs)3d [%(levelname)s]",    __TAGS_SHORT),
+    'long'      : ("%(levelname)s]",                            __TAGS_LONG),
+    'long-time' : ("[%(asctime)s.%(msecs)3d %(levelname)s]",    __TAGS_LONG_TIME),
+}
+
+# utility dict
+__LEVEL_VALUES = {
+    'DEBUG'     : logging.DEBUG,
+    'INFO'      : logging.INFO,
+    'ECHO'      : ECHO_LEVEL,
+    'WARNING'   : logging.WARNING,
+    # 'NOTIF'   : logging.NOTIF,
+    'ERROR'     : logging.ERROR,
+    'CRITICAL'  : logging.CRITICAL,
+    'NOTSET'    : logging.NOTSET,
+}
 
 
 def echo(*args, **kwargs):
@@ -53,31 +109,32 @@ def echo(*args, **kwargs):
     """
     
     log = get_logger()
+    # nothing would be logged anyway, so skip the frame/source lookups entirely
+    if not log.isEnabledFor(ECHO_LEVEL):
+        return
     
-    frame = inspect.currentframe().f_back
-    frameinfo = inspect.getframeinfo(frame)
-    
-    line = frameinfo.code_context[0]
-    lineno = frameinfo.lineno
-    fpath = frameinfo.filename
+    # grab the caller's frame directly; inspect.getframeinfo() goes through
+    # getsourcefile()/findsource() and hits the disk on every call
+    frame = sys._getframe(1)
+    lineno = frame.f_lineno
+    fpath = frame.f_code.co_filename
     _, fname = os.path.split(fpath)
 
+    C = __echo_colors
     fmtstr = f"{fname} @ line {C.y}{lineno}{C.reset}:"
 
-    r = re.search(r"\((.*)\)", line).group(1)
-    vnames = r.split(", ")
-    n_kw = len(kwargs)
-    if n_kw > 0:
-        vnames = vnames[:n_kw+1]
-        for key, value in kwargs.items():
-            vnames.append(key)
-            args = args + (value,)
+    # positional args are named by their source expressions, kwargs by their keywords
+    vnames = __parse_call_site(frame.f_code, lineno, len(args))
+    if kwargs:
+        vnames = vnames + tuple(kwargs)
+        args = args + tuple(kwargs.values())
     for var, val in zip(vnames, args):
         log.echo(f"{fmtstr} \t {C.c}{var}{C.reset} => {C.g}{val}{C.reset}")
 
-def get_logger(level=None, fmt=None, id=None):
+def get_logger(level=None, fmt=None, id=None, buffered=False):
     """
     Sets up a custom logger.
+    Output is colored only when it goes to a terminal and the NO_COLOR environment variable is not set.
     
     Parameters
     ----------
@@ -91,18 +148,32 @@ def get_logger(level=None, fmt=None, id=None):
     id : str or None
         ID to use to identify the new logger. If None, it instead modifies the logging module's root logger.
         default: None
+    buffered : bool
+        If True, output is collected and written in chunks (every ~8 KiB, and on any WARNING or higher),
+        which is faster for high-volume logging but delays lower-level lines, echo() output included.
+        default: False
         
     Returns
     -------
     logger : logging.Logger
         The created logger (or root logger, if id=None).
     """
+    global __default_logger, __echo_colors
+    
+    # fast path: root logger was already configured and no reconfig was requested
+    if (level is None) and (fmt is None) and (id is None) and (not buffered) and (__default_logger is not None):
+        return __default_logger
+    
     logger = logging.getLogger(id)
-    # if args were passed, user clearly wants to overwrite the current config, so flush handlers
-    if (level is not None) or (fmt is not None):
+    # if args were passed, user clearly wants to overwrite the current config, so drop the handlers.
+    # the opt-in __BufferedStreamHandler (buffered=True) is closed first so the records it's holding get written
+    if (level is not None) or (fmt is not None) or buffered:
+        if id is None:
+            __default_logger = None
         
         for h in logger.handlers:
-            h.flush()
+            if isinstance(h, __BufferedStreamHandler):
+                h.close()
         logger.handlers.clear()
     
     # if logger has handlers, then it has been set up and should stay
@@ -117,74 +188,26 @@ def get_logger(level=None, fmt=None, id=None):
         if fmt == None:
             fmt='short-time'
         
-        # logging tags for formatting
-        tags = DotMap()
-        
-        tags.short.DEBUG       = "/"
-        tags.short.INFO        = "-"
-        tags.short.ECHO        = ">"
-        tags.short.WARNING     = "!"
-        # tags.short.NOTIF     = "o"
-        tags.short.ERROR       = "x"
-        tags.short.CRITICAL    = "X"
-        tags.short.NOTSET      = "?"
-        
-        tags.long.DEBUG        = "DEBUG"
-        tags.long.INFO         = "INFO"
-        tags.long.ECHO         = "ECHO"
-        tags.long.WARNING      = "WARN"
-        # tags.short.NOTIF     = "NOTIF"
-        tags.long.ERROR        = "ERROR"
-        tags.long.CRITICAL     = "FATAL"
-        tags.long.NOTSET       = "UNSET"
-        
-        # utility dict
-        values = DotMap()
-        
-        values.DEBUG           = logging.DEBUG
-        values.INFO            = logging.INFO
-        values.ECHO            = logging.ECHO
-        values.WARNING         = logging.WARNING
-        # values.NOTIF         = logging.NOTIF
-        values.ERROR           = logging.ERROR
-        values.CRITICAL        = logging.CRITICAL
-        values.NOTSET          = logging.NOTSET
-        
         # set up formatting strings
-        if fmt in ['short', 'short-time']:
-            __rename_logging_level_names(tags.short, values)
-            
-            if fmt == 'short':
-                fmt_str = f"[%(levelname)s]"
-            else: # fmt == 'short-time'
-                fmt_str = f"%(asctime)s.%(msecs)3d [%(levelname)s]"
-        
-        elif fmt in ['long', 'long-time']:
-            
-            if fmt == 'long':
-                fmt_str = f"%(levelname)s]"
-                for lvl, tag in tags.long.items():
-                    tags.long[lvl] = '[' + tag
-                    if len(tag) == 4:
-                        tags.long[lvl] = ' ' + tags.long[lvl]
-            else: # fmt == 'long-time'
-                fmt_str = f"[%(asctime)s.%(msecs)3d %(levelname)s]"
-                for lvl, tag in tags.long.items():
-                    if len(tag) == 4:
-                        tags.long[lvl] = ' ' + tag
-    
-            __rename_logging_level_names(tags.long, values)
-            
-        else:
-            raise ValueError(f"Invalid format string: {fmt}.")
+        try:
+            fmt_str, tags = __FORMATS[fmt]
+        except (KeyError, TypeError): # TypeError for unhashable values
+            raise ValueError(f"Invalid format string: {fmt}.") from None
+        __rename_logging_level_names(tags, __LEVEL_VALUES)
         
         # create logger
-        formatter = __CustomFormatter(fmt_str)
-        ch = logging.StreamHandler()
+        ch = __BufferedStreamHandler() if buffered else logging.StreamHandler()
+        # only color output that's going to a terminal, and respect NO_COLOR (https://no-color.org)
+        isatty = getattr(ch.stream, 'isatty', None)
+        colors = C if (isatty and isatty() and not os.environ.get('NO_COLOR')) else __NO_COLOR
+        formatter = __CustomFormatter(fmt_str, colors)
         ch.setLevel(level)
         ch.setFormatter(formatter)
         logger.setLevel(level)
         logger.addHandler(ch)
+        if id is None:
+            __default_logger = logger
+            __echo_colors = colors
         
         # return it
         return logger
@@ -206,43 +229,123 @@ def newline(n=1):
     """
     log = get_logger()
     if log.level <= logging.INFO:
-        print(''.join(('\n',)*(n-1)))
+        sys.stdout.write('\n' * n)
 
 # custom formatter to support color formatting and etc
 class __CustomFormatter(logging.Formatter):
     
-    def __init__(self, fmt_str):
+    def __init__(self, fmt_str, colors=C):
+        # the base Formatter only handles the fmt_str header (time/level),
+        # and the message is appended to it directly in formatMessage()
+        super().__init__(fmt_str, r"%H:%M:%S")
         self.fmt_str = fmt_str
-        self.FORMATS = {
-            logging.DEBUG        : C.b    + fmt_str + C.reset + f' %(message)s',
-            logging.INFO         : C.g    + fmt_str + C.reset + f' %(message)s',
-            logging.ECHO         : C.m    + fmt_str + C.reset + f' %(message)s',
-            logging.WARNING      : C.y    + fmt_str + C.reset + f' %(message)s',
-            logging.ERROR        : C.r    + fmt_str + C.reset + f' %(message)s',
-            logging.CRITICAL     : C.bg_r + fmt_str + C.reset + f' %(message)s',
-            logging.NOTSET       : C.gy   + fmt_str + C.reset + f' %(message)s',
+        self.PREFIXES = {
+            logging.DEBUG        : colors.b,
+            logging.INFO         : colors.g,
+            logging.ECHO         : colors.m,
+            logging.WARNING      : colors.y,
+            logging.ERROR        : colors.r,
+            logging.CRITICAL     : colors.bg_r,
+            logging.NOTSET       : colors.gy,
         }
+        self.SUFFIX = colors.reset + ' '
+        # without a timestamp the header only depends on the level, so it's built once
+        # per (levelno, levelname) and the Formatter machinery is skipped entirely
+        self.headers = None if self.usesTime() else {}
 
     def format(self, record):
-        log_fmt = self.FORMATS.get(record.levelno)
-        formatter = logging.Formatter(log_fmt, r"%H:%M:%S")
-        return formatter.format(record)
+        if (self.headers is None) or record.exc_info or record.exc_text or record.stack_info:
+            return super().format(record)
+        
+        key = (record.levelno, record.levelname)
+        header = self.headers.get(key)
+        if header is None:
+            prefix = self.PREFIXES.get(record.levelno)
+            if prefix is None: # unknown level, so just the message (same as formatMessage)
+                header = ''
+            else:
+                header = prefix + self.fmt_str % {'levelname': record.levelname} + self.SUFFIX
+            self.headers[key] = header
+        
+        record.message = record.getMessage()
+        return header + record.message
+
+    def formatMessage(self, record):
+        prefix = self.PREFIXES.get(record.levelno)
+        if prefix is None: # unknown level, so just the message (same as logging.Formatter(None))
+            return record.message
+        return prefix + self._style.format(record) + self.SUFFIX + record.message
+
+# stream handler used by get_logger(buffered=True), which coalesces records into fewer write() calls.
+# the buffer is flushed once it reaches `capacity` characters, on any record at or above
+# `flush_level`, on an explicit flush(), and on close (logging.shutdown() does this at exit).
+class __BufferedStreamHandler(logging.StreamHandler):
+    
+    def __init__(self, stream=None, capacity=8192, flush_level=logging.WARNING):
+        super().__init__(stream)
+        self.capacity = capacity
+        self.flush_level = flush_level
+        self.buffer = []
+        self.buffered = 0
+
+    def emit(self, record):
+        try:
+            msg = self.format(record) + self.terminator
+            self.buffer.append(msg)
+            self.buffered += len(msg)
+            if (record.levelno >= self.flush_level) or (self.buffered >= self.capacity):
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def flush(self):
+        self.acquire()
+        try:
+            if self.buffer:
+                # take the chunk out before writing, so a failed write drops it
+                # instead of making every later record fail on it again
+                chunk = ''.join(self.buffer)
+                self.buffer.clear()
+                self.buffered = 0
+                self.stream.write(chunk)
+            if self.stream and hasattr(self.stream, 'flush'):
+                self.stream.flush()
+        finally:
+            self.release()
+
+    def close(self):
+        try:
+            self.flush()
+        finally:
+            super().close()
 
 def __get_echo_level():
     if not hasattr(logging, 'ECHO'):
         __add_logging_level('ECHO', ECHO_LEVEL)
     return logging.ECHO
 
-def __curr_time_str():
-    return datetime.now().strftime(format='%H:%M:%S')
+# echo() is often called repeatedly from the same line (e.g. inside a loop),
+# so the argument expressions are parsed once per call site and reused.
+# call sites are keyed by code object rather than file name, so reloading an edited
+# module (new code objects) parses the new source instead of reusing the old names.
+# only the first n_args expressions are needed (the rest are keyword args)
+@functools.lru_cache(maxsize=1024)
+def __parse_call_site(code, lineno, n_args):
+    fpath = code.co_filename
+    # drop stale lines if the file changed on disk (what inspect.getframeinfo() used to do for us)
+    linecache.checkcache(fpath)
+    line = linecache.getline(fpath, lineno)
+    r = __ARG_RE.search(line).group(1)
+    return tuple(r.split(", ", n_args)[:n_args])
 
 def __rename_logging_level_names(tags, vals):
+    # invert once to level number -> tag, so each level is a single lookup
+    names = {val: tags[key] for key, val in vals.items()}
     for level in list(logging._levelToName):
         
-        name = None
-        for key, val in vals.items():
-            if val == level:
-                name = tags[key]
+        name = names.get(level)
         if name == None:
             name = logging.getLevelName(level)
         